@@ -1,15 +1,22 @@
-import UnityPy
 import os
 import sys
 import json
-from PIL import Image
 import argparse
 import glob
+import hashlib
+import shutil
+import time
+from collections import OrderedDict
+# UnityPy, PIL and the process pool are imported inside the functions that decode or encode assets,
+# so --help and bundle listing/search start instantly even where importing UnityPy takes seconds.
 
 # --- Blue Archive Specific Configuration ---
 BLUE_ARCHIVE_BUNDLE_SRC_PATH = "/sdcard/Android/data/com.nexon.bluearchive/files/PUB/Resource/GameData/Android/"
 DEFAULT_EXTRACTED_OUTPUT_BASE_DIR = "/sdcard/extracted/"
 DEFAULT_REPACKED_OUTPUT_DIR = "/sdcard/repacked/"
+RISH_PATH = "/data/data/com.termux/files/usr/bin/rish" # Shizuku shell
+DEFAULT_ATLAS_CACHE_SIZE = 4 # Decoded atlas textures kept in memory while cropping sprites
+DEFAULT_WATCH_INTERVAL = 0.15 # Seconds between polls of an extracted folder in watch mode
 SCRIPT_VERSION = "1.0 BA Global Advanced Search Edition"
 
 # ANSI Color Codes
@@ -66,33 +73,38 @@ def get_ingame_name_from_bundle(filename):
         except Exception: pass
     return None
 
+def find_bundles(base_path, search_term=None):
+    # Sprite-looking bundles ("smart scan"), or every bundle whose name contains search_term.
+    found = []
+    for item_name in os.listdir(base_path):
+        if not item_name.lower().endswith(".bundle"):
+            continue
+        if search_term is None and not ("spr" in item_name.lower() or "sprite" in item_name.lower()):
+            continue
+        if search_term is not None and search_term not in item_name.lower():
+            continue
+        full_path = os.path.join(base_path, item_name)
+        if search_term is None and not os.path.isfile(full_path):
+            continue
+        basename = os.path.basename(full_path)
+        found.append({
+            "path": full_path, "basename": basename, "ingame_name": get_ingame_name_from_bundle(basename),
+            "source": "smart_scan" if search_term is None else "broad_search"
+        })
+    found.sort(key=lambda x: x["basename"])
+    return found
+
 def select_bundle_interactive(base_path):
     print(f"\n[Interactive Bundle Selection]")
     if not os.path.isdir(base_path):
         print(f"{Colors.YELLOW}Error: Bundle source path '{base_path}' not found.{Colors.RESET}")
         return None, None
 
-    master_bundle_list = []
-    master_bundle_basenames = set()
-
     # Part 1: Initial Smart Scan
     print("Performing initial smart scan for character/item sprites...")
-    initial_finds = 0
-    for item_name in os.listdir(base_path):
-        if not item_name.lower().endswith(".bundle"):
-            continue
-        if "spr" in item_name.lower() or "sprite" in item_name.lower():
-            full_path = os.path.join(base_path, item_name)
-            if os.path.isfile(full_path):
-                basename = os.path.basename(full_path)
-                if basename not in master_bundle_basenames:
-                    ingame_name = get_ingame_name_from_bundle(basename)
-                    master_bundle_list.append({
-                        "path": full_path, "basename": basename, "ingame_name": ingame_name, "source": "smart_scan"
-                    })
-                    master_bundle_basenames.add(basename)
-                    initial_finds +=1
-    master_bundle_list.sort(key=lambda x: x["basename"])
+    master_bundle_list = find_bundles(base_path)
+    master_bundle_basenames = set(b["basename"] for b in master_bundle_list)
+    initial_finds = len(master_bundle_list)
     current_display_list = list(master_bundle_list) # Start with smart scan results
     print(f"Initial scan found {initial_finds} potential sprite bundles.")
 
@@ -154,19 +166,12 @@ def select_bundle_interactive(base_path):
             new_finds_broad_search = 0
             found_during_this_broad_search = []
 
-            for item_name in os.listdir(base_path): # Scan all files in base_path
-                if not item_name.lower().endswith(".bundle"):
-                    continue
-                if term_to_search in item_name.lower():
-                    full_path = os.path.join(base_path, item_name)
-                    basename = os.path.basename(full_path)
-                    if basename not in master_bundle_basenames: # Only add if truly new
-                        ingame_name = get_ingame_name_from_bundle(basename) # Try to get a name anyway
-                        bundle_data = {"path": full_path, "basename": basename, "ingame_name": ingame_name, "source": "broad_search"}
-                        master_bundle_list.append(bundle_data)
-                        found_during_this_broad_search.append(bundle_data)
-                        master_bundle_basenames.add(basename)
-                        new_finds_broad_search += 1
+            for bundle_data in find_bundles(base_path, term_to_search): # Scan all files in base_path
+                if bundle_data["basename"] not in master_bundle_basenames: # Only add if truly new
+                    master_bundle_list.append(bundle_data)
+                    found_during_this_broad_search.append(bundle_data)
+                    master_bundle_basenames.add(bundle_data["basename"])
+                    new_finds_broad_search += 1
             
             if new_finds_broad_search > 0:
                 master_bundle_list.sort(key=lambda x: x["basename"]) # Re-sort master list
@@ -178,8 +183,118 @@ def select_bundle_interactive(base_path):
             continue
 
 
-# --- Core Extraction Logic (remains the same) ---
-def extract_bundle(bundle_path, output_dir_for_bundle):
+# --- Sprite Atlas Helpers ---
+# Sprite packing rotations (Unity's SpritePackingRotation) mapped to the PIL transpose that turns an
+# atlas crop (top-down, as returned by Texture2D.image) into the sprite image, and back again.
+SPRITE_ROTATION_TO_SPRITE = {1: "FLIP_LEFT_RIGHT", 2: "FLIP_TOP_BOTTOM", 3: "ROTATE_180", 4: "ROTATE_90"}
+SPRITE_ROTATION_TO_ATLAS = {1: "FLIP_LEFT_RIGHT", 2: "FLIP_TOP_BOTTOM", 3: "ROTATE_180", 4: "ROTATE_270"}
+
+class DecodedAtlasCache:
+    # Small LRU of decoded Texture2D images, so each atlas is decoded once however many sprites use it.
+    def __init__(self, max_size=DEFAULT_ATLAS_CACHE_SIZE):
+        self.max_size = max(1, max_size)
+        self._images = OrderedDict()
+        self._pinned = {} # Atlases rebuilt from edits (watch mode); never evicted, since decoding them again would be lossy
+        self.pasted_sprites = {} # key -> {sprite PNG path: (placement, name)} already pasted into a pinned atlas
+
+    def get(self, key, load_texture):
+        # load_texture parses the Texture2D and is only called on a miss, so hits cost no parsing at all.
+        if key in self._pinned: return self._pinned[key]
+        if key in self._images:
+            self._images.move_to_end(key)
+            return self._images[key]
+        img = load_texture().image
+        if img is not None: self.put(key, img)
+        return img
+
+    def peek(self, key):
+        return self._pinned.get(key, self._images.get(key))
+
+    def pin(self, key, img):
+        self._images.pop(key, None)
+        self._pinned[key] = img
+
+    def put(self, key, img):
+        self._images[key] = img
+        self._images.move_to_end(key)
+        while len(self._images) > self.max_size: self._images.popitem(last=False)
+
+def get_reader_cache_key(reader):
+    return (id(reader.assets_file), reader.path_id)
+
+def get_object_cache_key(data):
+    # Newer UnityPy exposes the reader as 'object_reader', older releases as 'reader'.
+    return get_reader_cache_key(getattr(data, "object_reader", None) or getattr(data, "reader", None))
+
+def get_pptr_reader(pptr):
+    # Resolves a PPtr to its ObjectReader without parsing the object ('deref' in newer UnityPy, 'get_obj' in older).
+    return pptr.deref() if hasattr(pptr, "deref") else pptr.get_obj()
+
+def get_sprite_settings(settings_raw):
+    # Newer UnityPy keeps settingsRaw as the packed int, older releases wrap it in a SpriteSettings object.
+    if not isinstance(settings_raw, int): settings_raw = getattr(settings_raw, "settingsRaw", 0)
+    packed = settings_raw & 1; packing_mode = (settings_raw >> 1) & 1; packing_rotation = (settings_raw >> 2) & 0xF; mesh_type = (settings_raw >> 6) & 1
+    return packed, packing_mode, packing_rotation, mesh_type
+
+def get_sprite_unsupported_reason(sprite):
+    # Why a Sprite can't be cut as a plain rectangle of one Texture2D (it then goes through Sprite.image), or None.
+    sprite_atlas = getattr(sprite, "m_SpriteAtlas", None)
+    if (sprite_atlas is not None and sprite_atlas.path_id) or getattr(sprite, "m_AtlasTags", None): return "is packed through a SpriteAtlas asset"
+    render_data = sprite.m_RD
+    alpha_texture = getattr(render_data, "alphaTexture", None)
+    if alpha_texture is not None and alpha_texture.path_id: return "keeps its alpha channel in a separate texture"
+    if not render_data.texture.path_id: return "has no texture"
+    packed, packing_mode, _, mesh_type = get_sprite_settings(render_data.settingsRaw)
+    # Only a tight-packed atlas sprite with a tight mesh can share its rectangle with neighbours (kSPMTight, kSpriteMeshTypeTight).
+    if packed and packing_mode == 0 and mesh_type == 1: return "is tight-packed, so its shape comes from the sprite mesh"
+    return None
+
+def get_sprite_render_data(sprite):
+    return sprite.m_RD if get_sprite_unsupported_reason(sprite) is None else None
+
+def get_sprite_placement(render_data):
+    # (x, y, width, height, packed, rotation): a plain tuple, so it can be sent to worker processes.
+    rect = render_data.textureRect
+    packed, _, packing_rotation, _ = get_sprite_settings(render_data.settingsRaw)
+    return (rect.x, rect.y, rect.width, rect.height, packed, packing_rotation)
+
+def get_sprite_atlas_box(placement, atlas_height):
+    # textureRect is measured from the bottom of the texture, the decoded image starts at the top.
+    x, y, width, height = placement[:4]
+    left = round(x); right = round(x + width)
+    top = round(atlas_height - y - height); bottom = round(atlas_height - y)
+    return (left, top, right, bottom)
+
+def crop_sprite_from_atlas(atlas_image, placement):
+    from PIL import Image
+    sprite_image = atlas_image.crop(get_sprite_atlas_box(placement, atlas_image.height))
+    packed, packing_rotation = placement[4:]
+    if packed and packing_rotation in SPRITE_ROTATION_TO_SPRITE: sprite_image = sprite_image.transpose(getattr(Image, SPRITE_ROTATION_TO_SPRITE[packing_rotation]))
+    return sprite_image
+
+def paste_sprite_into_atlas(atlas_image, sprite_image, placement):
+    from PIL import Image
+    packed, packing_rotation = placement[4:]
+    if packed and packing_rotation in SPRITE_ROTATION_TO_ATLAS: sprite_image = sprite_image.transpose(getattr(Image, SPRITE_ROTATION_TO_ATLAS[packing_rotation]))
+    left, top, right, bottom = get_sprite_atlas_box(placement, atlas_image.height)
+    if sprite_image.size != (right - left, bottom - top): raise ValueError(f"image is {sprite_image.size[0]}x{sprite_image.size[1]}, expected {right - left}x{bottom - top}")
+    atlas_image.paste(sprite_image.convert(atlas_image.mode), (left, top))
+
+def get_sprite_image(sprite, atlas_cache):
+    if atlas_cache is not None:
+        render_data = get_sprite_render_data(sprite)
+        if render_data is not None:
+            texture_reader = get_pptr_reader(render_data.texture)
+            atlas_image = atlas_cache.get(get_reader_cache_key(texture_reader), texture_reader.read)
+            if atlas_image is not None: return crop_sprite_from_atlas(atlas_image, get_sprite_placement(render_data))
+    return sprite.image
+
+def images_equal(a, b):
+    return a.size == b.size and a.convert(b.mode).tobytes() == b.tobytes()
+
+# --- Core Extraction Logic ---
+def extract_bundle(bundle_path, output_dir_for_bundle, atlas_cache_size=DEFAULT_ATLAS_CACHE_SIZE):
+    import UnityPy
     print(f"\n[Sensei's Workshop] Starting extraction for: '{os.path.basename(bundle_path)}'")
     print(f"Outputting to: '{output_dir_for_bundle}'")
     ensure_dir(output_dir_for_bundle)
@@ -209,12 +324,22 @@ def extract_bundle(bundle_path, output_dir_for_bundle):
 
     total_objects = len(env.objects)
     print(f"Found {total_objects} assets in the bundle.")
+    atlas_cache = DecodedAtlasCache(atlas_cache_size) if atlas_cache_size > 0 else None
+    sprite_data = {}; atlas_keys = set() # Only textures that sprites are cut from go in the cache; the rest are freed once saved
+    if atlas_cache is not None:
+        for obj in env.objects:
+            if obj.type.name != "Sprite": continue
+            try:
+                data = sprite_data[get_reader_cache_key(obj)] = obj.read() # Kept for the main loop below, so each Sprite is parsed once
+                render_data = get_sprite_render_data(data)
+                if render_data is not None: atlas_keys.add(get_reader_cache_key(get_pptr_reader(render_data.texture)))
+            except Exception: pass # Reported when the main loop reads it again
 
     for i, obj in enumerate(env.objects):
         asset_info = {"path_id": obj.path_id, "type": str(obj.type.name), "name": "", "extracted_filename": ""}
         print(f"\rProcessing asset {i+1}/{total_objects} (Type: {obj.type.name})...", end="", flush=True)
         try:
-            data = obj.read()
+            data = sprite_data.pop(get_reader_cache_key(obj), None) or obj.read()
             asset_name_original = getattr(data, "m_Name", "")
             asset_name = sanitize_name(asset_name_original)
             if not asset_name: asset_name = f"{sanitize_name(str(obj.type.name))}_{obj.path_id}"
@@ -224,7 +349,9 @@ def extract_bundle(bundle_path, output_dir_for_bundle):
                 try:
                     filename = f"{asset_name}_{obj.path_id}.png"
                     filepath = os.path.join(dir_textures, filename)
-                    img = data.image
+                    if obj.type.name == "Sprite": img = get_sprite_image(data, atlas_cache)
+                    elif get_reader_cache_key(obj) in atlas_keys: img = atlas_cache.get(get_reader_cache_key(obj), lambda: data)
+                    else: img = data.image
                     if img: img.save(filepath); asset_info["extracted_filename"] = os.path.join("Textures", filename); processed = True
                 except Exception as e: print(f"\n    {Colors.YELLOW}Warning: Error saving {obj.type.name} {asset_name}: {e}{Colors.RESET}")
             elif obj.type.name == "TextAsset":
@@ -292,31 +419,157 @@ def extract_bundle(bundle_path, output_dir_for_bundle):
     print(f"Manifest saved to '{manifest_path}'")
     print(f"{Colors.CYAN}せんせい、抽出が完了しました！{Colors.RESET} (Extraction complete, Sensei!)")
 
-# --- Core Repacking Logic (remains the same) ---
-def repack_bundle(input_dir_with_manifest, output_bundle_full_path):
-    print(f"\n[Sensei's Workshop] Repacking assets from: '{input_dir_with_manifest}'")
-    print(f"Outputting new bundle to: '{output_bundle_full_path}'")
+# --- Core Repacking Logic ---
+def apply_texture_edits(texture_edits, sprite_edits, atlas_cache=None, jobs=None, modified_path_ids=None):
+    # Folds texture and sprite PNGs into one image per atlas and re-encodes each changed atlas once; returns the assets applied.
+    from PIL import Image
+    atlas_edits = OrderedDict() # key -> {"reader", "texture", "texture_png", "sprites"}
+    for key, (texture, path) in texture_edits.items():
+        atlas_edits[key] = {"reader": None, "texture": texture, "texture_png": path, "sprites": []}
+    for sprite, path, name in sprite_edits:
+        unsupported_reason = get_sprite_unsupported_reason(sprite)
+        if unsupported_reason:
+            try: edited = not images_equal(Image.open(path), sprite.image) # Only worth a warning if the PNG was actually changed
+            except Exception: edited = True
+            if edited: print(f"\n    {Colors.YELLOW}Sprite {name} was edited, but it {unsupported_reason} and can't be pasted back. Edit the texture PNG(s) it is cut from instead. Skipped.{Colors.RESET}")
+            continue
+        render_data = sprite.m_RD
+        texture_reader = get_pptr_reader(render_data.texture)
+        key = get_reader_cache_key(texture_reader)
+        if key not in atlas_edits: atlas_edits[key] = {"reader": texture_reader, "texture": None, "texture_png": None, "sprites": []}
+        atlas_edits[key]["sprites"].append((get_sprite_placement(render_data), path, name))
+
+    def atlas_jobs():
+        # Built one at a time as worker slots free up, so only the atlases in flight are held in memory.
+        for key, edit in atlas_edits.items():
+            try:
+                if edit["texture"] is None: edit["texture"] = edit["reader"].read() # Parsed once per atlas, not per sprite
+                texture = edit["texture"]
+                object_reader = getattr(texture, "object_reader", None) or getattr(texture, "reader", None)
+                platform = getattr(object_reader, "platform", 0); platform_blob = getattr(texture, "m_PlatformBlob", None)
+                current_image = atlas_cache.peek(key) if atlas_cache is not None else None
+                decode_args = None
+                if current_image is None:
+                    image_data = texture.get_image_data() if hasattr(texture, "get_image_data") else texture.image_data
+                    decode_args = (image_data, texture.m_Width, texture.m_Height, int(texture.m_TextureFormat), getattr(object_reader, "version", (0, 0, 0, 0)), platform, platform_blob)
+            except Exception as e: print(f"\n    {Colors.YELLOW}Error reading atlas texture for {len(edit['sprites'])} sprite(s): {e}{Colors.RESET}"); continue
+            yield key, {
+                "name": getattr(texture, "m_Name", ""), "current_image": current_image, "decode_args": decode_args,
+                "texture_png": edit["texture_png"], "sprites": edit["sprites"],
+                "pasted_sprites": [(placement, path, name) for path, (placement, name) in (atlas_cache.pasted_sprites.get(key, {}) if atlas_cache is not None else {}).items()],
+                "encode_args": (int(texture.m_TextureFormat), platform, platform_blob), "return_image": atlas_cache is not None,
+            }
+
+    applied_count = 0
+    for key, result in run_atlas_jobs(atlas_jobs(), len(atlas_edits), jobs):
+        texture = atlas_edits[key]["texture"]
+        if isinstance(result, Exception): print(f"    {Colors.YELLOW}Error re-encoding texture {getattr(texture, 'm_Name', '')}: {result}{Colors.RESET}"); continue
+        if result is None: continue # Nothing differs from the current atlas
+        img_data, texture_format, size, edit_count, pasted, warnings, atlas_image = result
+        for warning in warnings: print(f"    {Colors.YELLOW}{warning}{Colors.RESET}")
+        try:
+            assign_encoded_texture(texture, size, img_data, texture_format); applied_count += edit_count
+            if atlas_cache is not None:
+                atlas_cache.pin(key, atlas_image) # Later edits (watch mode) start from this image, not a lossy re-decode
+                atlas_cache.pasted_sprites.setdefault(key, {}).update((path, (placement, name)) for placement, path, name in pasted)
+            if modified_path_ids is not None: modified_path_ids.add(key[1])
+        except Exception as e: print(f"    {Colors.YELLOW}Error re-encoding texture {getattr(texture, 'm_Name', '')}: {e}{Colors.RESET}")
+        del result, img_data, atlas_image # Drop this atlas before the next result arrives
+    return applied_count
+
+def rebuild_atlas(job):
+    # Process-pool worker: returns None if nothing changed, else (data, format, size, edit count, pasted, warnings, image).
+    from PIL import Image
+    from UnityPy.export import Texture2DConverter
+    try:
+        warnings = []; applied_count = 0; atlas = None; pasted = []
+        reference = job["current_image"]
+        if reference is None: reference = Texture2DConverter.parse_image_data(*job["decode_args"])
+        if job["texture_png"]:
+            texture_image = Image.open(job["texture_png"]); texture_image.load()
+            if not images_equal(texture_image, reference): atlas = texture_image; applied_count += 1 # Otherwise keep the original encoding
+        sprites = [(sprite, False) for sprite in job["sprites"]]
+        if atlas is not None: # The PNG replaced the whole atlas, so earlier sprite edits must go back on top
+            sprite_paths = set(path for _, path, _ in job["sprites"])
+            sprites += [(sprite, True) for sprite in job["pasted_sprites"] if sprite[1] not in sprite_paths]
+        if atlas is not None and atlas.size != reference.size and sprites:
+            warnings.append(f"Atlas texture PNG {job['name']} was resized; sprite edits on it were skipped."); sprites = []
+        for (placement, path, name), repaste in sprites:
+            try:
+                sprite_image = Image.open(path)
+                if not repaste and images_equal(sprite_image, crop_sprite_from_atlas(reference, placement)): continue # Untouched sprite
+                if atlas is None: atlas = reference.copy()
+                elif atlas.mode != reference.mode: atlas = atlas.convert(reference.mode)
+                paste_sprite_into_atlas(atlas, sprite_image, placement); pasted.append((placement, path, name))
+                if not repaste: applied_count += 1
+            except Exception as e: warnings.append(f"Error applying Sprite {name} from '{path}': {e}")
+        if atlas is None: return None
+        img_data, texture_format = Texture2DConverter.image_to_texture2d(atlas, *job["encode_args"])
+        return img_data, texture_format, atlas.size, applied_count, pasted, warnings, (atlas if job["return_image"] else None)
+    except Exception as e: return e # Returned rather than raised so one bad texture doesn't cancel the batch
+
+def run_atlas_jobs(atlas_jobs, job_count, jobs=None):
+    # Yields (key, result) as atlases finish, with at most `jobs` in flight; sequential if no pool can be started.
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+    from concurrent.futures.process import BrokenProcessPool
+    jobs = min(jobs or os.cpu_count() or 1, job_count)
+    if job_count: print(f"\nRebuilding {job_count} texture(s) using {max(jobs, 1)} worker(s)...")
+    executor = None
+    if jobs > 1:
+        try: executor = ProcessPoolExecutor(max_workers=jobs)
+        except (ImportError, NotImplementedError, OSError) as e: # e.g. Termux/Android without a working sem_open
+            print(f"    {Colors.YELLOW}Warning: Process pool unavailable ({e}). Encoding sequentially.{Colors.RESET}")
+    if executor is None:
+        for key, job in atlas_jobs: yield key, rebuild_atlas(job)
+        return
+    with executor:
+        pending = {}
+        for key, job in atlas_jobs:
+            while len(pending) >= jobs:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done: yield pending.pop(future), (future.exception() or future.result())
+            try: pending[executor.submit(rebuild_atlas, job)] = key
+            except BrokenProcessPool as e: yield key, e # A worker died (e.g. killed for memory); report and carry on
+            del job
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done: yield pending.pop(future), (future.exception() or future.result())
+
+def assign_encoded_texture(texture, size, img_data, texture_format):
+    # Mirrors UnityPy's Texture2D.set_image, minus the encode that already ran in the pool.
+    texture.m_Width, texture.m_Height = size
+    if getattr(texture, "m_MipMap", None) is not None: texture.m_MipMap = False
+    if getattr(texture, "m_MipCount", None) is not None: texture.m_MipCount = 1
+    texture.image_data = img_data; texture.m_CompleteImageSize = len(img_data); texture.m_TextureFormat = texture_format
+    if getattr(texture, "m_StreamData", None) is not None: texture.m_StreamData.path = ""; texture.m_StreamData.offset = 0; texture.m_StreamData.size = 0
+    texture.save()
+
+def load_repack_manifest(input_dir_with_manifest):
     manifest_path = os.path.join(input_dir_with_manifest, "manifest.json")
-    if not os.path.exists(manifest_path): print(f"{Colors.YELLOW}Error: manifest.json not found in '{input_dir_with_manifest}'. Cannot repack.{Colors.RESET}"); return
+    if not os.path.exists(manifest_path): print(f"{Colors.YELLOW}Error: manifest.json not found in '{input_dir_with_manifest}'. Cannot repack.{Colors.RESET}"); return None, None
     with open(manifest_path, "r", encoding="utf-8") as f: manifest = json.load(f)
     original_bundle_path = manifest.get("original_bundle_path")
-    if not original_bundle_path or not os.path.exists(original_bundle_path): print(f"{Colors.YELLOW}Error: Original bundle path '{original_bundle_path}' from manifest is invalid or not found.{Colors.RESET}"); return
-    print(f"Using original bundle '{os.path.basename(original_bundle_path)}' as template.")
-    env = UnityPy.load(original_bundle_path)
-    modified_count = 0; total_assets_in_manifest = len(manifest["assets"])
-    print(f"Found {total_assets_in_manifest} assets in manifest to process.")
-    for idx, asset_entry in enumerate(manifest["assets"]):
+    if not original_bundle_path or not os.path.exists(original_bundle_path): print(f"{Colors.YELLOW}Error: Original bundle path '{original_bundle_path}' from manifest is invalid or not found.{Colors.RESET}"); return None, None
+    return manifest, original_bundle_path
+
+def apply_asset_edits(env, input_dir_with_manifest, asset_entries, jobs=None, atlas_cache=None, modified_path_ids=None):
+    # Returns the number of assets modified; their PathIDs are added to modified_path_ids if given.
+    modified_count = 0; total_assets = len(asset_entries)
+    texture_edits = {}; sprite_edits = [] # Re-encoded per atlas once every manifest entry has been read
+    objects_by_path_id = {obj.path_id: obj for obj in env.objects}
+    for idx, asset_entry in enumerate(asset_entries):
         if asset_entry["extracted_filename"] == "ERROR_EXTRACTING" or not asset_entry["extracted_filename"]: continue
         original_path_id = asset_entry["path_id"]; extracted_file_rel_path = asset_entry["extracted_filename"]
         asset_type = asset_entry["type"]; asset_name_from_manifest = asset_entry.get("name", f"Unnamed_PathID_{original_path_id}")
         modified_file_path = os.path.join(input_dir_with_manifest, extracted_file_rel_path)
-        print(f"\rProcessing asset {idx+1}/{total_assets_in_manifest} (PathID: {original_path_id}, Name: {asset_name_from_manifest[:30]}...).", end="", flush=True)
+        print(f"\rProcessing asset {idx+1}/{total_assets} (PathID: {original_path_id}, Name: {asset_name_from_manifest[:30]}...).", end="", flush=True)
         if os.path.exists(modified_file_path):
-            target_obj = next((obj for obj in env.objects if obj.path_id == original_path_id), None)
+            target_obj = objects_by_path_id.get(original_path_id)
             if target_obj:
                 try:
                     data = target_obj.read(); asset_updated = False
-                    if asset_type in ["Texture2D", "Sprite"]: img = Image.open(modified_file_path); data.image = img; data.save(); asset_updated = True
+                    if asset_type == "Texture2D": texture_edits[get_object_cache_key(data)] = (data, modified_file_path)
+                    elif asset_type == "Sprite": sprite_edits.append((data, modified_file_path, asset_name_from_manifest))
                     elif asset_type == "TextAsset":
                         with open(modified_file_path, "rb") as f: new_script_bytes = f.read()
                         if isinstance(data.script, str):
@@ -341,13 +594,37 @@ def repack_bundle(input_dir_with_manifest, output_bundle_full_path):
                         with open(modified_file_path, "rb") as f: raw_generic_data = f.read()
                         if hasattr(target_obj, 'raw_data'): target_obj.raw_data = raw_generic_data; asset_updated = True
                         else: print(f"\n    {Colors.YELLOW}Generic asset {asset_name_from_manifest}: No direct raw_data field on target_obj. Skipped repacking.{Colors.RESET}")
-                    if asset_updated: modified_count += 1
+                    if asset_updated:
+                        modified_count += 1
+                        if modified_path_ids is not None: modified_path_ids.add(original_path_id)
                 except Exception as e: print(f"\n    {Colors.YELLOW}Error updating PathID {original_path_id} ({asset_name_from_manifest}) from '{extracted_file_rel_path}': {e}{Colors.RESET}")
+    if texture_edits or sprite_edits: modified_count += apply_texture_edits(texture_edits, sprite_edits, atlas_cache, jobs, modified_path_ids)
+    return modified_count
+
+def record_repack_in_manifest(input_dir_with_manifest, manifest, output_bundle_full_path, modified_path_ids):
+    # Lets 'verify' tell intended changes apart from accidental ones.
+    manifest["repacked_bundle_path"] = os.path.abspath(output_bundle_full_path)
+    manifest["modified_path_ids"] = sorted(modified_path_ids)
+    manifest_path = os.path.join(input_dir_with_manifest, "manifest.json")
+    open(manifest_path, "w", encoding="utf-8").write(json.dumps(manifest, indent=4))
+
+def repack_bundle(input_dir_with_manifest, output_bundle_full_path, jobs=None):
+    import UnityPy
+    print(f"\n[Sensei's Workshop] Repacking assets from: '{input_dir_with_manifest}'")
+    print(f"Outputting new bundle to: '{output_bundle_full_path}'")
+    manifest, original_bundle_path = load_repack_manifest(input_dir_with_manifest)
+    if not manifest: return
+    print(f"Using original bundle '{os.path.basename(original_bundle_path)}' as template.")
+    env = UnityPy.load(original_bundle_path)
+    print(f"Found {len(manifest['assets'])} assets in manifest to process.")
+    modified_path_ids = set()
+    modified_count = apply_asset_edits(env, input_dir_with_manifest, manifest["assets"], jobs, modified_path_ids=modified_path_ids)
     print("\nRepacking process finished.")
     if modified_count > 0:
         try:
             output_bundle_dir = os.path.dirname(os.path.abspath(output_bundle_full_path)); ensure_dir(output_bundle_dir)
             with open(output_bundle_full_path, "wb") as f: f.write(env.file.save())
+            record_repack_in_manifest(input_dir_with_manifest, manifest, output_bundle_full_path, modified_path_ids)
             print(f"Repacking complete! {modified_count} asset(s) potentially modified.")
             print(f"New bundle saved to: '{output_bundle_full_path}'")
             print(f"{Colors.CYAN}任務完了、せんせい！{Colors.RESET} (Mission complete, Sensei!)")
@@ -359,11 +636,176 @@ def repack_bundle(input_dir_with_manifest, output_bundle_full_path):
         elif os.path.exists(output_bundle_full_path):
             print(f"'{output_bundle_full_path}' might be identical to the original or previous version if no effective changes were made.")
 
-# --- Main Function and Argparse (remains the same) ---
+# --- Watch Mode ---
+def snapshot_extracted_files(input_dir_with_manifest, extracted_filenames):
+    # (mtime, size) per extracted file, so saves can be spotted by polling.
+    snapshot = {}
+    for rel_path in extracted_filenames:
+        try: st = os.stat(os.path.join(input_dir_with_manifest, rel_path)); snapshot[rel_path] = (st.st_mtime_ns, st.st_size)
+        except OSError: pass
+    return snapshot
+
+def get_deploy_command_prefix(deploy_path):
+    # [] if deploy_path is writable, else a su/rish prefix probed like kivotos_tool.py's deploy, else None.
+    import subprocess
+    if os.access(deploy_path if os.path.exists(deploy_path) else os.path.dirname(os.path.abspath(deploy_path)), os.W_OK): return []
+    print("Deploy target is protected. Probing for high-privilege access method...")
+    try:
+        subprocess.run(['su', '-c', 'id -u'], check=True, capture_output=True)
+        print("  Root (su) access detected."); return ['su', '-c']
+    except (subprocess.CalledProcessError, FileNotFoundError): pass
+    if os.path.exists(RISH_PATH): print("  Shizuku (rish) access detected."); return [RISH_PATH, '-c']
+    return None
+
+def deploy_bundle(bundle_path, deploy_path, cmd_prefix):
+    import subprocess, shlex
+    if not cmd_prefix: shutil.copyfile(bundle_path, deploy_path); return
+    env = None
+    if 'rish' in cmd_prefix[0]: env = os.environ.copy(); env['RISH_APPLICATION_ID'] = 'com.termux'
+    # dd gives a direct overwrite inside protected game storage.
+    result = subprocess.run(cmd_prefix + [f"dd if={shlex.quote(bundle_path)} of={shlex.quote(deploy_path)}"], capture_output=True, text=True, env=env)
+    if result.returncode != 0: raise OSError(f"privileged dd failed ({result.returncode}): {result.stderr.strip()}")
+
+def watch_bundle(input_dir_with_manifest, output_bundle_full_path, interval=DEFAULT_WATCH_INTERVAL, deploy_path=None, jobs=None):
+    import UnityPy
+    print(f"\n[Sensei's Workshop] Watching '{input_dir_with_manifest}' for edits")
+    print(f"Rewriting bundle on every save to: '{output_bundle_full_path}'")
+    manifest, original_bundle_path = load_repack_manifest(input_dir_with_manifest)
+    if not manifest: return
+    if deploy_path and os.path.isdir(deploy_path): deploy_path = os.path.join(deploy_path, os.path.basename(original_bundle_path))
+    deploy_cmd_prefix = None
+    if deploy_path:
+        print(f"Each new bundle will be deployed to: '{deploy_path}'")
+        if os.path.abspath(deploy_path) == os.path.abspath(original_bundle_path):
+            print(f"{Colors.YELLOW}Warning: Deploying over the original bundle. Later repacks of this folder will use the modded file as their template.{Colors.RESET}")
+        deploy_cmd_prefix = get_deploy_command_prefix(deploy_path)
+        if deploy_cmd_prefix is None:
+            print(f"{Colors.YELLOW}Error: '{deploy_path}' is not writable and neither root (su) nor Shizuku (rish) is available.{Colors.RESET}"); return
+        # Asked once for the whole session rather than on every save.
+        user_confirm = input(f"{Colors.YELLOW}This will overwrite '{deploy_path}' every time a change is saved. Are you sure? (y/n): {Colors.RESET}").lower()
+        if user_confirm != 'y': print("Watch cancelled by user."); return
+    print(f"Loading original bundle '{os.path.basename(original_bundle_path)}' once for the whole session...")
+    env = UnityPy.load(original_bundle_path)
+    atlas_cache = DecodedAtlasCache() # Kept across saves so a sprite edit doesn't decode its atlas again
+    modified_path_ids = set() # Everything changed this session, since each rewrite contains all earlier edits
+    entries_by_file = {entry["extracted_filename"]: entry for entry in manifest["assets"] if entry.get("extracted_filename") and entry["extracted_filename"] != "ERROR_EXTRACTING"}
+    ensure_dir(os.path.dirname(os.path.abspath(output_bundle_full_path)))
+
+    def write_bundle(modified_count, started):
+        temp_output_path = output_bundle_full_path + ".tmp"
+        with open(temp_output_path, "wb") as f: f.write(env.file.save())
+        os.replace(temp_output_path, output_bundle_full_path) # Readers never see a half-written bundle
+        record_repack_in_manifest(input_dir_with_manifest, manifest, output_bundle_full_path, modified_path_ids)
+        print(f"\n[Watch] {modified_count} asset(s) applied, bundle rewritten in {time.time() - started:.2f}s: '{output_bundle_full_path}'")
+        if deploy_path: deploy_bundle(output_bundle_full_path, deploy_path, deploy_cmd_prefix); print(f"[Watch] Deployed to '{deploy_path}'")
+
+    # Snapshot before applying, so a file saved while the edits below are applied is picked up by the first poll.
+    snapshot = snapshot_extracted_files(input_dir_with_manifest, entries_by_file)
+    unsettled = {} # Files seen changing on the previous poll, with the stat seen then
+    try:
+        # Edits made before the session (e.g. since the last repack) go in first, as repack does; every rewrite keeps them.
+        print("Applying the folder's current edits...")
+        started = time.time()
+        try:
+            modified_count = apply_asset_edits(env, input_dir_with_manifest, list(entries_by_file.values()), jobs, atlas_cache, modified_path_ids)
+            if modified_count: write_bundle(modified_count, started)
+            else: print("\n[Watch] No edits found yet.")
+        except Exception as e: print(f"\n{Colors.YELLOW}[Watch] Error applying the current edits: {e}{Colors.RESET}")
+        print(f"Watching {len(snapshot)} extracted file(s), polling every {interval}s. Press Ctrl+C to stop.")
+        while True:
+            time.sleep(interval)
+            current = snapshot_extracted_files(input_dir_with_manifest, entries_by_file)
+            changed_stats = {rel_path: stat for rel_path, stat in current.items() if snapshot.get(rel_path) != stat}
+            # A change is applied once a poll sees the same stat as the one before it, i.e. the editor finished writing.
+            changed = [rel_path for rel_path, stat in changed_stats.items() if unsettled.get(rel_path) == stat]
+            unsettled = {rel_path: stat for rel_path, stat in changed_stats.items() if rel_path not in changed}
+            if not changed: continue
+            snapshot.update((rel_path, changed_stats[rel_path]) for rel_path in changed)
+            started = time.time()
+            print(f"\n[Watch] Change detected: {', '.join(changed)}")
+            try:
+                modified_count = apply_asset_edits(env, input_dir_with_manifest, [entries_by_file[rel_path] for rel_path in changed], jobs, atlas_cache, modified_path_ids)
+                if not modified_count: print("\n[Watch] No assets were updated from this change."); continue
+                write_bundle(modified_count, started)
+            except Exception as e: print(f"\n{Colors.YELLOW}[Watch] Error applying change: {e}{Colors.RESET}")
+    except KeyboardInterrupt:
+        print(f"\n{Colors.CYAN}お疲れ様でした、せんせい！{Colors.RESET} (Watch stopped, Sensei!)")
+
+# --- Verification ---
+def get_object_raw_data(obj):
+    return obj.get_raw_data() if hasattr(obj, 'get_raw_data') else obj.raw_data
+
+def summarize_bundle_objects(env, decode_path_ids=()):
+    # (assets file, PathID) -> (type, size, SHA-1, read error); Texture2Ds in decode_path_ids are decoded too.
+    summary = {}
+    for obj in env.objects:
+        raw_data = get_object_raw_data(obj); read_error = None
+        try:
+            data = obj.read()
+            if obj.path_id in decode_path_ids and obj.type.name == "Texture2D": data.image
+        except Exception as e: read_error = str(e) or type(e).__name__
+        summary[(obj.assets_file.name, obj.path_id)] = (obj.type.name, len(raw_data), hashlib.sha1(raw_data).hexdigest(), read_error)
+    return summary
+
+def verify_repacked_bundle(input_dir_with_manifest):
+    # Process-pool worker: returns (input_dir, problems, notes, object_count) for one extracted folder.
+    import UnityPy
+    problems = []; notes = []
+    try:
+        with open(os.path.join(input_dir_with_manifest, "manifest.json"), "r", encoding="utf-8") as f: manifest = json.load(f)
+    except (OSError, ValueError) as e: return input_dir_with_manifest, [f"Cannot read manifest.json: {e}"], notes, 0
+    original_bundle_path = manifest.get("original_bundle_path"); repacked_bundle_path = manifest.get("repacked_bundle_path")
+    if not repacked_bundle_path or "modified_path_ids" not in manifest: return input_dir_with_manifest, ["manifest.json has no repack record. Repack this folder first."], notes, 0
+    for label, path in (("Original", original_bundle_path), ("Repacked", repacked_bundle_path)):
+        if not path or not os.path.exists(path): return input_dir_with_manifest, [f"{label} bundle '{path}' not found."], notes, 0
+    modified_path_ids = set(manifest["modified_path_ids"])
+    try: original_objects = summarize_bundle_objects(UnityPy.load(original_bundle_path), modified_path_ids)
+    except Exception as e: return input_dir_with_manifest, [f"Original bundle could not be read: {e}"], notes, 0
+    try: repacked_objects = summarize_bundle_objects(UnityPy.load(repacked_bundle_path), modified_path_ids)
+    except Exception as e: return input_dir_with_manifest, [f"Repacked bundle could not be loaded: {e}"], notes, 0
+    for key, (obj_type, size, digest, read_error) in original_objects.items():
+        path_id = key[1]
+        if key not in repacked_objects: problems.append(f"PathID {path_id} ({obj_type}) is missing from the repacked bundle."); continue
+        new_type, new_size, new_digest, new_read_error = repacked_objects[key]
+        # Objects UnityPy can't parse in the original (ERROR_EXTRACTING in the manifest) aren't the repack's fault.
+        if new_read_error and not read_error: problems.append(f"PathID {path_id} ({new_type}) is unreadable: {new_read_error}")
+        elif new_read_error: notes.append(f"PathID {path_id} ({obj_type}) was already unreadable in the original: {read_error}")
+        if new_type != obj_type: problems.append(f"PathID {path_id} changed type from {obj_type} to {new_type}.")
+        elif new_digest != digest and path_id not in modified_path_ids: problems.append(f"PathID {path_id} ({obj_type}) changed unexpectedly ({size} -> {new_size} bytes).")
+        elif new_digest == digest and path_id in modified_path_ids: notes.append(f"PathID {path_id} ({obj_type}) was repacked but is byte-identical to the original.")
+    for key in repacked_objects.keys() - original_objects.keys():
+        problems.append(f"PathID {key[1]} ({repacked_objects[key][0]}) is not in the original bundle.")
+        if repacked_objects[key][3]: problems.append(f"PathID {key[1]} ({repacked_objects[key][0]}) is unreadable: {repacked_objects[key][3]}")
+    return input_dir_with_manifest, problems, notes, len(repacked_objects)
+
+def verify_bundles(input_dirs, jobs=None):
+    # Returns True if every folder passed.
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+    print(f"\n[Sensei's Workshop] Verifying {len(input_dirs)} repacked bundle(s)...")
+    jobs = min(jobs or os.cpu_count() or 1, len(input_dirs))
+    results = None
+    if jobs > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as executor: results = list(executor.map(verify_repacked_bundle, input_dirs))
+        except (ImportError, NotImplementedError, OSError, BrokenProcessPool) as e:
+            print(f"{Colors.YELLOW}Warning: Process pool unavailable ({e}). Verifying sequentially.{Colors.RESET}")
+    if results is None: results = [verify_repacked_bundle(input_dir) for input_dir in input_dirs]
+    failed_count = 0
+    for input_dir, problems, notes, object_count in results:
+        if problems:
+            failed_count += 1
+            print(f"\n{Colors.YELLOW}FAIL{Colors.RESET} {input_dir}")
+            for problem in problems: print(f"    {Colors.YELLOW}{problem}{Colors.RESET}")
+        else: print(f"\n{Colors.CYAN}OK{Colors.RESET}   {input_dir} ({object_count} objects checked)")
+        for note in notes: print(f"    Note: {note}")
+    if failed_count: print(f"\n{failed_count} of {len(results)} bundle(s) need attention before deploying, Sensei.")
+    else: print(f"\n{Colors.CYAN}全部大丈夫です、せんせい！{Colors.RESET} (All bundles look good, Sensei!)")
+    return failed_count == 0
+
+# --- Main Function and Argparse ---
 def main():
     print_ba_header()
-    ensure_dir(DEFAULT_EXTRACTED_OUTPUT_BASE_DIR)
-    ensure_dir(DEFAULT_REPACKED_OUTPUT_DIR)
 
     parser = argparse.ArgumentParser(
         description=f"Kivotos Halo Asset Tool (v{SCRIPT_VERSION}) - Extract and repack Unity .bundle files for Blue Archive.",
@@ -381,18 +823,35 @@ Examples:
   To extract (bundle selected interactively, output to {DEFAULT_EXTRACTED_OUTPUT_BASE_DIR}MyCustomStudentFolder/):
     python %(prog)s extract MyCustomStudentFolder
 
+  To list sprite bundles, or search every bundle by name (no assets are decoded):
+    python %(prog)s list
+    python %(prog)s list yuuka
+
   To repack (e.g., from {DEFAULT_EXTRACTED_OUTPUT_BASE_DIR}MyCustomStudentFolder/):
     python %(prog)s repack "{os.path.join(DEFAULT_EXTRACTED_OUTPUT_BASE_DIR, "MyCustomStudentFolder")}" RepackedStudent.bundle
       (Output will be: {os.path.join(DEFAULT_REPACKED_OUTPUT_DIR, "RepackedStudent.bundle")})
+
+  To rewrite that bundle every time a file in the folder is saved (Ctrl+C to stop):
+    python %(prog)s watch "{os.path.join(DEFAULT_EXTRACTED_OUTPUT_BASE_DIR, "MyCustomStudentFolder")}" RepackedStudent.bundle
+
+  To check the repacked bundle(s) before copying them to the game:
+    python %(prog)s verify "{os.path.join(DEFAULT_EXTRACTED_OUTPUT_BASE_DIR, "MyCustomStudentFolder")}"
 """
     )
-    subparsers = parser.add_subparsers(dest="command", required=True, help="Sub-command to execute: 'extract' or 'repack'")
+    subparsers = parser.add_subparsers(dest="command", required=True, help="Sub-command to execute: 'extract', 'list', 'repack', 'watch' or 'verify'")
 
     parser_extract = subparsers.add_parser("extract", help="Extract a bundle (selected interactively from Blue Archive path).")
     parser_extract.add_argument(
         "output_subfolder_name", nargs='?', default=None,
         help=(f"Optional: Custom name for the subfolder within '{DEFAULT_EXTRACTED_OUTPUT_BASE_DIR}'. If omitted, uses the bundle's name.")
     )
+    parser_extract.add_argument(
+        "--atlas-cache", type=int, default=DEFAULT_ATLAS_CACHE_SIZE, metavar="N",
+        help=f"Number of decoded atlas textures kept in memory while cropping sprites (default: {DEFAULT_ATLAS_CACHE_SIZE}). 0 disables it and leaves sprites to UnityPy's Sprite.image (recent UnityPy keeps its own unbounded cache of decoded atlases per file)."
+    )
+
+    parser_list = subparsers.add_parser("list", help="List sprite bundles in the Blue Archive path, or search all bundles by name.")
+    parser_list.add_argument("search_term", nargs='?', default=None, help="Optional: Text in the bundle filename (e.g. yuuka). If omitted, lists the smart scan results.")
 
     parser_repack = subparsers.add_parser("repack", help="Repack a directory into a new .bundle file.")
     parser_repack.add_argument(
@@ -403,6 +862,21 @@ Examples:
         "output_filename",
         help=f"Filename for the new repacked .bundle (e.g., 'MyRepackedBundle.bundle'). It will be saved in '{DEFAULT_REPACKED_OUTPUT_DIR}'."
     )
+    parser_repack.add_argument(
+        "--jobs", "-j", type=int, default=None, metavar="N",
+        help="Worker processes for re-encoding textures (default: number of CPU cores). 1 encodes sequentially."
+    )
+
+    parser_watch = subparsers.add_parser("watch", help="Keep a bundle loaded and rewrite it whenever a file in its extracted folder is saved.")
+    parser_watch.add_argument("input_dir", help="Directory containing extracted assets and manifest.json to watch.")
+    parser_watch.add_argument("output_filename", help=f"Filename for the repacked .bundle, rewritten on every save. It will be saved in '{DEFAULT_REPACKED_OUTPUT_DIR}'.")
+    parser_watch.add_argument("--interval", type=float, default=DEFAULT_WATCH_INTERVAL, metavar="SECONDS", help=f"Polling interval (default: {DEFAULT_WATCH_INTERVAL}).")
+    parser_watch.add_argument("--deploy-to", default=None, metavar="PATH", help="Also deploy each new bundle to this file, or into this directory under the original bundle's name.\nProtected game storage is written with dd through su or Shizuku (rish); you confirm once at start.")
+    parser_watch.add_argument("--jobs", "-j", type=int, default=None, metavar="N", help="Worker processes for re-encoding textures (default: number of CPU cores).")
+
+    parser_verify = subparsers.add_parser("verify", help="Check repacked bundles against their originals without starting the game.")
+    parser_verify.add_argument("input_dirs", nargs='+', metavar="input_dir", help="Extracted folder(s) that have been repacked (their manifest.json records the output bundle).")
+    parser_verify.add_argument("--jobs", "-j", type=int, default=None, metavar="N", help="Bundles verified in parallel (default: number of CPU cores).")
 
     args = parser.parse_args()
 
@@ -417,9 +891,18 @@ Examples:
             output_dir_name_base = "untitled_extraction"
             print(f"{Colors.YELLOW}Warning: Output folder name was invalid or empty after sanitization. Using '{output_dir_name_base}'.{Colors.RESET}")
         output_directory_for_this_bundle = os.path.join(DEFAULT_EXTRACTED_OUTPUT_BASE_DIR, output_dir_name_base)
-        extract_bundle(selected_bundle_path, output_directory_for_this_bundle)
-
-    elif args.command == "repack":
+        extract_bundle(selected_bundle_path, output_directory_for_this_bundle, args.atlas_cache)
+
+    elif args.command == "list":
+        if not os.path.isdir(BLUE_ARCHIVE_BUNDLE_SRC_PATH): print(f"{Colors.YELLOW}Error: Bundle source path '{BLUE_ARCHIVE_BUNDLE_SRC_PATH}' not found.{Colors.RESET}"); sys.exit(1)
+        found_bundles = find_bundles(BLUE_ARCHIVE_BUNDLE_SRC_PATH, args.search_term.lower() if args.search_term else None)
+        for item_data in found_bundles:
+            if item_data["ingame_name"]: print(f"  {item_data['basename']} ({Colors.CYAN}Detected: {item_data['ingame_name']}{Colors.RESET})")
+            else: print(f"  {item_data['basename']}")
+        print(f"{len(found_bundles)} bundle(s) found.")
+
+    elif args.command in ("repack", "watch"):
+        if args.command == "watch" and args.interval <= 0: print(f"{Colors.YELLOW}Error: --interval must be greater than 0 seconds.{Colors.RESET}"); sys.exit(1)
         input_dir_abs = os.path.abspath(args.input_dir)
         if not os.path.isdir(input_dir_abs): print(f"{Colors.YELLOW}Error: Input directory for repacking '{input_dir_abs}' not found.{Colors.RESET}"); sys.exit(1)
         if not os.path.exists(os.path.join(input_dir_abs, "manifest.json")): print(f"{Colors.YELLOW}Error: manifest.json not found in '{input_dir_abs}'. Not a valid extracted bundle folder.{Colors.RESET}"); sys.exit(1)
@@ -428,7 +911,11 @@ Examples:
         if not any(sane_output_filename.lower().endswith(ext) for ext in ['.bundle', '.unity3d', '.asset', '.assets']):
             print(f"{Colors.YELLOW}Warning: Output filename '{sane_output_filename}' lacks a common bundle extension (e.g., '.bundle').{Colors.RESET}")
         final_repacked_bundle_path = os.path.join(DEFAULT_REPACKED_OUTPUT_DIR, sane_output_filename)
-        repack_bundle(input_dir_abs, final_repacked_bundle_path)
+        if args.command == "watch": watch_bundle(input_dir_abs, final_repacked_bundle_path, args.interval, args.deploy_to, args.jobs)
+        else: repack_bundle(input_dir_abs, final_repacked_bundle_path, args.jobs)
+
+    elif args.command == "verify":
+        if not verify_bundles([os.path.abspath(input_dir) for input_dir in args.input_dirs], args.jobs): sys.exit(1)
 
 if __name__ == "__main__":
     if "com.termux" in os.environ.get("PREFIX", "") or "/sdcard/" in str(os.getcwd()):
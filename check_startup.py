@@ -0,0 +1,50 @@
+import os
+import sys
+import argparse
+import subprocess
+
+# Keeps ba_asset_tool.py's cold start low: commands that don't decode assets must not import UnityPy or PIL,
+# which take seconds to load on a phone. Run after changing imports: python check_startup.py
+TOOL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ba_asset_tool.py")
+FORBIDDEN_MODULES = ("UnityPy", "PIL")
+DEFAULT_BUDGET_MS = 150 # Total import time per command, as reported by python -X importtime
+COMMANDS = (["--help"], ["list"])
+
+class Colors:
+    CYAN = '\033[96m'
+    YELLOW = '\033[93m'
+    RESET = '\033[0m'
+
+def measure_imports(tool_args):
+    # Returns (total import time in ms, imported module names, stderr without the import log) for one run of the tool.
+    result = subprocess.run([sys.executable, "-X", "importtime", TOOL_PATH] + tool_args, capture_output=True, text=True, stdin=subprocess.DEVNULL)
+    total_us = 0; modules = []; other_lines = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or line.endswith("imported package"): other_lines.append(line); continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules.append(name.strip())
+        if not name[1:].startswith(" "): total_us += int(cumulative) # Only top-level imports, nested ones are in their cumulative time
+    return total_us / 1000, modules, "\n".join(other_lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail if ba_asset_tool.py imports UnityPy/PIL or exceeds its import-time budget on start.")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help=f"Import-time budget per command in milliseconds (default: {DEFAULT_BUDGET_MS}).")
+    args = parser.parse_args()
+
+    failed = False
+    for tool_args in COMMANDS:
+        command = " ".join(tool_args)
+        total_ms, modules, errors = measure_imports(tool_args)
+        problems = []
+        if "Traceback" in errors: problems.append(f"crashed:\n{errors}")
+        heavy = sorted(set(module.split(".")[0] for module in modules) & set(FORBIDDEN_MODULES))
+        if heavy: problems.append(f"imports {', '.join(heavy)}")
+        if total_ms > args.budget_ms: problems.append(f"imports took {total_ms:.0f} ms, over the {args.budget_ms:.0f} ms budget")
+        if problems:
+            failed = True
+            for problem in problems: print(f"{Colors.YELLOW}FAIL{Colors.RESET} {command}: {problem}")
+        else: print(f"{Colors.CYAN}OK{Colors.RESET}   {command}: {total_ms:.0f} ms, {len(modules)} modules")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()